@@ -2,12 +2,24 @@
 Main Claims Processing Agent
 Orchestrates the claim extraction, validation, and routing process
 """
+import copy
+import hashlib
 import json
-from typing import Dict, Any, List
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 import sys
 import os
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
@@ -15,15 +27,28 @@ from pdf_parser import DocumentParser
 from field_extractor import FieldExtractor
 from routing_engine import RoutingEngine
 
+# Pipeline components are stateless, so every agent in a process shares them
+shared_parser = DocumentParser()
+shared_extractor = FieldExtractor()
+shared_router = RoutingEngine()
+
 
 class ClaimsProcessingAgent:
     """Main agent for processing insurance claims"""
     
+    # Number of results kept in the content-hash cache
+    RESULT_CACHE_SIZE = 1024
+    
+    # Extractor fields used internally for routing, not reported
+    INTERNAL_FIELDS = frozenset({"estimated_damage_value"})
+    
     def __init__(self):
-        self.parser = DocumentParser()
-        self.extractor = FieldExtractor()
-        self.router = RoutingEngine()
+        self.parser = shared_parser
+        self.extractor = shared_extractor
+        self.router = shared_router
         self.processed_count = 0
+        self._result_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def process_claim(self, document_path: str) -> Dict[str, Any]:
         """
@@ -36,6 +61,15 @@ class ClaimsProcessingAgent:
             Dictionary with extracted fields, missing fields, and routing decision
         """
         
+        # Reuse the result for identical document content seen before
+        cache_key = self._cache_key(document_path)
+        if cache_key is not None:
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                cached["document_path"] = document_path
+                self.processed_count += 1
+                return cached
+        
         # Step 1: Parse the document
         try:
             document_text = self.parser.parse_document(document_path)
@@ -49,14 +83,19 @@ class ClaimsProcessingAgent:
                 "reasoning": f"Document parsing failed: {str(e)}"
             }
         
+        # Upper-case the text once for the extractor's keyword checks
+        document_text_upper = document_text.upper()
+        
         # Step 2: Extract fields
-        extracted_fields = self.extractor.extract_fields(document_text)
+        extracted_fields = self.extractor.extract_fields(document_text, document_text_upper)
         
         # Step 3: Validate fields (identify missing mandatory fields)
         missing_fields = self.extractor.validate_fields(extracted_fields)
         
         # Step 4: Check for fraud indicators
-        fraud_indicators = self.extractor.check_for_fraud_indicators(document_text)
+        fraud_indicators = self.extractor.check_for_fraud_indicators(
+            document_text, document_text_upper
+        )
         
         # Step 5: Determine routing
         routing_decision = self.router.determine_route(
@@ -76,18 +115,25 @@ class ClaimsProcessingAgent:
             "reasoning": routing_decision["reasoning"]
         }
         
+        if cache_key is not None:
+            self._store_cached_result(cache_key, result)
+        
         self.processed_count += 1
         return result
     
-    def process_multiple_claims(self, directory_path: str) -> List[Dict[str, Any]]:
+    def process_multiple_claims(self, directory_path: str,
+                                max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Process multiple claim documents from a directory
         
         Args:
             directory_path: Path to directory containing claim documents
+            max_workers: Number of worker processes. Defaults to processing
+                serially in this process: spawning workers costs a few hundred
+                milliseconds, more than a typical batch takes serially.
             
         Returns:
-            List of processing results
+            List of processing results, in file order
         """
         results = []
         
@@ -103,17 +149,91 @@ class ClaimsProcessingAgent:
             print(f"No documents found in {directory_path}")
             return results
         
+        if not max_workers or max_workers <= 1:
+            for file_path in supported_files:
+                print(f"Processing: {file_path.name}...")
+                result = self.process_claim(str(file_path))
+                results.append(result)
+            return results
+        
+        return self._process_claims_in_pool(supported_files, max_workers)
+    
+    def _process_claims_in_pool(self, supported_files: List[Path],
+                                max_workers: int) -> List[Dict[str, Any]]:
+        """Process claims in worker processes, serving cache hits from this process"""
+        entries = []
+        pending_paths = []
         for file_path in supported_files:
-            print(f"Processing: {file_path.name}...")
-            result = self.process_claim(str(file_path))
-            results.append(result)
+            cache_key = self._cache_key(str(file_path))
+            cached = None if cache_key is None else self._get_cached_result(cache_key)
+            if cached is None:
+                pending_paths.append(str(file_path))
+            entries.append((file_path, cache_key, cached))
+        
+        results = []
+        
+        # Documents are independent, so parse them in parallel. Use "spawn"
+        # since pdfplumber is not fork-safe on every platform. No worker is
+        # started when every document is already cached.
+        with ProcessPoolExecutor(
+            max_workers=max(1, min(max_workers, len(pending_paths))),
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            # Results come back in submission order, so walk the files alongside them
+            pending_results = executor.map(_process_claim_in_worker, pending_paths)
+            for file_path, cache_key, cached in entries:
+                print(f"Processing: {file_path.name}...")
+                if cached is not None:
+                    cached["document_path"] = str(file_path)
+                    self.processed_count += 1
+                    results.append(cached)
+                    continue
+                
+                result = next(pending_results)
+                if result.get("status") == "SUCCESS":
+                    if cache_key is not None:
+                        self._store_cached_result(cache_key, result)
+                    self.processed_count += 1
+                results.append(result)
         
         return results
     
+    def _cache_key(self, document_path: str) -> Optional[str]:
+        """Hash a supported document's extension and bytes, or None if unreadable"""
+        if not self.parser.is_supported_format(document_path):
+            return None
+        
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(document_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        
+        return f"{Path(document_path).suffix.lower()}:{digest.hexdigest()}"
+    
+    def _get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached result, marking it most recently used"""
+        with self._cache_lock:
+            result = self._result_cache.get(cache_key)
+            if result is None:
+                return None
+            self._result_cache.move_to_end(cache_key)
+        return copy.deepcopy(result)
+    
+    def _store_cached_result(self, cache_key: str, result: Dict[str, Any]) -> None:
+        """Cache a copy of a result, evicting the least recently used entry"""
+        with self._cache_lock:
+            self._result_cache[cache_key] = copy.deepcopy(result)
+            self._result_cache.move_to_end(cache_key)
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+    
     def _clean_extracted_fields(self, extracted_fields: Dict[str, Any]) -> Dict[str, Any]:
         """Remove None values and internal fields from extracted fields"""
         return {k: v for k, v in extracted_fields.items() 
-                if v is not None and not k.endswith("_value")}
+                if v is not None and k not in self.INTERNAL_FIELDS}
     
     def save_results(self, results: List[Dict[str, Any]], output_path: str) -> None:
         """
@@ -127,8 +247,12 @@ class ClaimsProcessingAgent:
         if directory:
             os.makedirs(directory, exist_ok=True)
         
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        if HAS_ORJSON:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(results, default=str, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(results, f, indent=2, default=str)
         
         print(f"Results saved to: {output_path}")
     
@@ -152,6 +276,17 @@ class ClaimsProcessingAgent:
         print("="*60 + "\n")
 
 
+_worker_agent: Optional[ClaimsProcessingAgent] = None
+
+
+def _process_claim_in_worker(document_path: str) -> Dict[str, Any]:
+    """Process a claim in a pool worker, reusing one agent per process"""
+    global _worker_agent
+    if _worker_agent is None:
+        _worker_agent = ClaimsProcessingAgent()
+    return _worker_agent.process_claim(document_path)
+
+
 def main():
     """Main entry point"""
     import argparse
@@ -169,6 +304,12 @@ def main():
         help="Output JSON file path",
         default="output/claims_processing_results.json"
     )
+    parser.add_argument(
+        "-w", "--workers",
+        help="Worker processes for directory input (default: process serially)",
+        type=int,
+        default=None
+    )
     
     args = parser.parse_args()
     
@@ -182,7 +323,7 @@ def main():
         results = [result]
     elif os.path.isdir(args.input):
         # Directory
-        results = agent.process_multiple_claims(args.input)
+        results = agent.process_multiple_claims(args.input, max_workers=args.workers)
     else:
         print(f"Error: {args.input} is not a valid file or directory")
         return
@@ -1,49 +1,82 @@
 """
-Minimal Flask API server for the claims processing agent.
+Minimal Quart (async Flask-compatible) API server for the claims processing agent.
 Serves the React frontend and exposes a file upload API.
 """
+import asyncio
 import os
+import shutil
 import tempfile
 from typing import Dict, Any
 
-from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
+from quart import Quart, request, jsonify, send_from_directory
+from quart.json.provider import DefaultJSONProvider
+from quart_cors import route_cors
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 from agent import ClaimsProcessingAgent
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 FRONTEND_DIR = os.path.join(BASE_DIR, "frontend")
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson, keeping sorted keys"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        option = orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
 
-app = Flask(__name__, static_folder=FRONTEND_DIR)
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
 
-# Enable CORS for Render deployment
-CORS(app, resources={
-    r"/api/*": {
-        "origins": ["*"],
-        "methods": ["GET", "POST", "OPTIONS"],
-        "allow_headers": ["Content-Type"]
-    }
-})
+
+app = Quart(__name__, static_folder=FRONTEND_DIR)
+if HAS_ORJSON:
+    app.json = OrjsonProvider(app)
+
+# Quart defaults to a 16 MiB body cap and 60 s body/response timeouts, which
+# Flask never had. Keep the Flask behaviour: no upload size limit, and no
+# timeout on slow uploads or long-running claim parsing.
+app.config["MAX_CONTENT_LENGTH"] = None
+app.config["BODY_TIMEOUT"] = None
+app.config["RESPONSE_TIMEOUT"] = None
+
+# Enable CORS on the API routes for Render deployment
+api_cors = route_cors(
+    allow_origin="*",
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=["Content-Type"]
+)
 
 agent = ClaimsProcessingAgent()
 
 
 @app.get("/")
-def index() -> Any:
-    return send_from_directory(FRONTEND_DIR, "index.html")
+async def index() -> Any:
+    return await send_from_directory(FRONTEND_DIR, "index.html")
 
 
 @app.get("/frontend/<path:filename>")
-def frontend_assets(filename: str) -> Any:
-    return send_from_directory(FRONTEND_DIR, filename)
+async def frontend_assets(filename: str) -> Any:
+    return await send_from_directory(FRONTEND_DIR, filename)
 
 
 @app.post("/api/claims/process")
-def process_claim() -> Any:
-    if "file" not in request.files:
+@api_cors
+async def process_claim() -> Any:
+    files = await request.files
+    if "file" not in files:
         return jsonify({"error": "No file provided"}), 400
 
-    upload = request.files["file"]
+    upload = files["file"]
     if not upload.filename:
         return jsonify({"error": "Empty filename"}), 400
 
@@ -52,13 +85,20 @@ def process_claim() -> Any:
     if ext not in [".pdf", ".txt"]:
         return jsonify({"error": "Only .pdf and .txt files are supported"}), 400
 
+    loop = asyncio.get_running_loop()
     temp_file_path = None
     try:
+        # Stream the upload straight into the open temp file in one pass
         with tempfile.NamedTemporaryFile(delete=False, suffix=ext) as temp_file:
-            upload.save(temp_file.name)
             temp_file_path = temp_file.name
+            await loop.run_in_executor(
+                None, shutil.copyfileobj, upload.stream, temp_file, UPLOAD_CHUNK_SIZE
+            )
 
-        result: Dict[str, Any] = agent.process_claim(temp_file_path)
+        # Parsing is CPU-bound; run it off the event loop so other requests proceed
+        result: Dict[str, Any] = await loop.run_in_executor(
+            None, agent.process_claim, temp_file_path
+        )
         return jsonify(result)
     finally:
         if temp_file_path and os.path.exists(temp_file_path):
@@ -66,10 +106,11 @@ def process_claim() -> Any:
 
 
 @app.post("/api/claims/process-form")
-def process_form() -> Any:
+@api_cors
+async def process_form() -> Any:
     """Process manually entered claim data from the form."""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         if not data:
             return jsonify({"error": "No data provided"}), 400
 
@@ -125,4 +166,6 @@ if __name__ == "__main__":
     port = int(os.getenv("API_PORT", 5000))
     debug = os.getenv("FLASK_DEBUG", "False") == "True"
     
-    app.run(host=host, port=port, debug=debug)
+    # For multi-worker deployments run under an ASGI server instead, e.g.
+    #   hypercorn api_server:app --bind 0.0.0.0:5000 --workers 4
+    app.run(host=host, port=port, debug=debug, use_reloader=debug)
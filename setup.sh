@@ -51,6 +51,7 @@ echo ""
 
 # Step 6: Verify installation
 echo "✔️  Step 6: Verifying installation..."
+python3 -c "import pypdfium2; print('✅ pypdfium2 available')"
 python3 -c "import pdfplumber; print('✅ pdfplumber available')"
 python3 -c "import PyPDF2; print('✅ PyPDF2 available')"
 echo ""
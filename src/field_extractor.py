@@ -3,7 +3,22 @@ Field Extraction Module for FNOL Claims
 Extracts key information from claim documents
 """
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+
+def _compile_field_pattern(pattern: str) -> Any:
+    """Compile a field pattern case-insensitively, with RE2 when available"""
+    if HAS_RE2:
+        # RE2 takes its flags inline
+        return re2.compile(f"(?im){pattern}")
+    return re.compile(pattern, re.IGNORECASE | re.MULTILINE)
+
 
 class FieldExtractor:
     """Extract structured fields from FNOL documents"""
@@ -18,44 +33,128 @@ class FieldExtractor:
         "estimated_damage"
     ]
     
-    # Field mapping patterns
+    # Placeholder values that indicate missing/invalid fields
+    PLACEHOLDER_VALUES = frozenset({
+        "not", "not provided", "n/a", "na", "unknown", "incomplete", "insufficient", "missing"
+    })
+    
+    # Field mapping patterns (compiled once below). RE2 (google-re2) is used
+    # when installed: it matches in linear time, so no keyword hit can make a
+    # capture backtrack. Otherwise the stdlib re is used; no free-form capture
+    # is followed by anything it could backtrack into, so re stays linear too.
+    # Keep these to the RE2-compatible subset: no lookaround or backreferences,
+    # and no large counted repeats, which bloat RE2's DFA. RE2's \s matches
+    # ASCII whitespace only, so e.g. a non-breaking space between keyword
+    # words only matches under re.
+    # Each pattern is paired with upper-case literals, at least one of which
+    # every keyword alternative contains. A field whose literals are all absent
+    # from the text cannot match, so its regex is skipped.
     FIELD_PATTERNS = {
-        "policy_number": r"(?:POLICY\s*(?:NUMBER|#)|POLICY_NUMBER)[:\s]*([0-9A-Za-z-]+)",
-        "policyholder_name": r"(?:NAME\s*OF\s*INSURED|POLICYHOLDER\s*NAME)[:\s]*([^,\n]+)",
-        "effective_date": r"(?:EFFECTIVE\s*DATE|COVERAGE\s*PERIOD)[:\s]*([0-9]{2}[/-][0-9]{2}[/-][0-9]{4})",
-        "incident_date": r"(?:DATE\s*OF\s*(?:LOSS|ACCIDENT)|DATE)[:\s]*([0-9]{2}[/-][0-9]{2}[/-][0-9]{4})",
-        "incident_time": r"(?:TIME)[:\s]*([0-9]{1,2}:[0-9]{2}\s*(?:AM|PM)?)",
-        "incident_location": r"(?:LOCATION\s*OF\s*(?:LOSS|ACCIDENT)|STREET|ADDRESS|LOC)[:\s]*([^;\n]+?)(?=\n|;|$)",
-        "city_state_zip": r"(?:CITY|CITY,\s*STATE)[:\s]*([^,\n]+(?:,[^,\n]+)*)",
-        "claimant_name": r"(?:NAME\s*OF\s*(?:CLAIMANT|CONTACT)|CONTACT\s*NAME)[:\s]*([^,\n]+)",
-        "third_party": r"(?:OTHER\s*(?:VEHICLE|PARTY)|THIRD\s*PARTY)[:\s]*([^\n]+)",
-        "contact_phone": r"(?:(?:PRIMARY\s*|SECONDARY\s*)?PHONE)[:\s]*([0-9]{3}[.-]?[0-9]{3}[.-]?[0-9]{4})",
-        "contact_email": r"(?:E-MAIL|EMAIL)[:\s]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
-        "asset_type": r"(?:INSURED\s*VEHICLE|ASSET\s*TYPE)[:\s]*([^\n]+)",
-        "vehicle_vin": r"(?:V\.I\.N\.|VIN)[:\s]*([A-HJ-NPR-Z0-9]{17})",
-        "vehicle_plate": r"(?:PLATE\s*NUMBER)[:\s]*([A-Za-z0-9]{2,8})",
-        "claim_type": r"(?:CLAIM\s*TYPE|LINE\s*OF\s*BUSINESS)[:\s]*([^\n]+)",
-        "estimated_damage": r"(?:ESTIMATE\s*(?:AMOUNT|DAMAGE)|ESTIMATED\s*(?:DAMAGE|LOSS))[:\s]*\$?([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{2})?)",
-        "accident_description": r"(?:DESCRIBE\s*(?:LOSS|ACCIDENT|DAMAGE)|DESCRIPTION)[:\s]*([^;]+(?:[;][^;]+)?)"
+        "policy_number": (
+            r"(?:POLICY\s*(?:NUMBER|#)|POLICY_NUMBER)[:\s]*([0-9A-Za-z-]+)",
+            ("POLICY",)
+        ),
+        "policyholder_name": (
+            r"(?:NAME\s*OF\s*INSURED|POLICYHOLDER\s*NAME)[:\s]*([^,\n]+)",
+            ("NAME",)
+        ),
+        "effective_date": (
+            r"(?:EFFECTIVE\s*DATE|COVERAGE\s*PERIOD)[:\s]*([0-9]{2}[/-][0-9]{2}[/-][0-9]{4})",
+            ("EFFECTIVE", "COVERAGE")
+        ),
+        "incident_date": (
+            r"(?:DATE\s*OF\s*(?:LOSS|ACCIDENT)|DATE)[:\s]*([0-9]{2}[/-][0-9]{2}[/-][0-9]{4})",
+            ("DATE",)
+        ),
+        "incident_time": (
+            r"(?:TIME)[:\s]*([0-9]{1,2}:[0-9]{2}\s*(?:AM|PM)?)",
+            ("TIME",)
+        ),
+        "incident_location": (
+            r"(?:LOCATION\s*OF\s*(?:LOSS|ACCIDENT)|STREET|ADDRESS|LOC)[:\s]*([^;\n]+)",
+            ("LOC", "STREET", "ADDRESS")
+        ),
+        "city_state_zip": (
+            r"(?:CITY|CITY,\s*STATE)[:\s]*([^,\n]+(?:,[^,\n]+)*)",
+            ("CITY",)
+        ),
+        "claimant_name": (
+            r"(?:NAME\s*OF\s*(?:CLAIMANT|CONTACT)|CONTACT\s*NAME)[:\s]*([^,\n]+)",
+            ("NAME",)
+        ),
+        "third_party": (
+            r"(?:OTHER\s*(?:VEHICLE|PARTY)|THIRD\s*PARTY)[:\s]*([^\n]+)",
+            ("OTHER", "THIRD")
+        ),
+        "contact_phone": (
+            r"(?:(?:PRIMARY\s*|SECONDARY\s*)?PHONE)[:\s]*([0-9]{3}[.-]?[0-9]{3}[.-]?[0-9]{4})",
+            ("PHONE",)
+        ),
+        "contact_email": (
+            r"(?:E-MAIL|EMAIL)[:\s]*([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})",
+            ("MAIL",)
+        ),
+        "asset_type": (
+            r"(?:INSURED\s*VEHICLE|ASSET\s*TYPE)[:\s]*([^\n]+)",
+            ("INSURED", "ASSET")
+        ),
+        "vehicle_vin": (
+            r"(?:V\.I\.N\.|VIN)[:\s]*([A-HJ-NPR-Z0-9]{17})",
+            ("VIN", "V.I.N.")
+        ),
+        "vehicle_plate": (
+            r"(?:PLATE\s*NUMBER)[:\s]*([A-Za-z0-9]{2,8})",
+            ("PLATE",)
+        ),
+        "claim_type": (
+            r"(?:CLAIM\s*TYPE|LINE\s*OF\s*BUSINESS)[:\s]*([^\n]+)",
+            ("CLAIM", "BUSINESS")
+        ),
+        "estimated_damage": (
+            r"(?:ESTIMATE\s*(?:AMOUNT|DAMAGE)|ESTIMATED\s*(?:DAMAGE|LOSS))[:\s]*\$?([0-9]{1,3}(?:,[0-9]{3})*(?:\.[0-9]{2})?)",
+            ("ESTIMATE",)
+        ),
+        "accident_description": (
+            r"(?:DESCRIBE\s*(?:LOSS|ACCIDENT|DAMAGE)|DESCRIPTION)[:\s]*([^;]+(?:;[^;]+)?)",
+            ("DESCRI",)
+        )
     }
+    FIELD_PATTERNS = {
+        name: (_compile_field_pattern(pattern), literals)
+        for name, (pattern, literals) in FIELD_PATTERNS.items()
+    }
+    
+    # Fallback patterns for locating the incident in the description
+    LOCATION_KEYWORD_PATTERN = re.compile(r"driveway|street|parking|intersection", re.IGNORECASE)
+    STREET_PATTERN = re.compile(r"(\w+\s+street)", re.IGNORECASE)
+    INTERSECTION_PATTERN = re.compile(r"intersection\s+of\s+([^.]+)", re.IGNORECASE)
+    
+    # Keywords that flag a claim for investigation
+    FRAUD_KEYWORDS = ["fraud", "inconsistent", "staged", "suspicious", "falsified"]
     
     def __init__(self):
         pass
     
-    def extract_fields(self, text: str) -> Dict[str, Any]:
+    def extract_fields(self, text: str, text_upper: Optional[str] = None) -> Dict[str, Any]:
         """
         Extract all fields from document text
         
         Args:
             text: Raw text from document
+            text_upper: text.upper(), if the caller already computed it
             
         Returns:
             Dictionary of extracted fields
         """
         extracted = {}
+        if text_upper is None:
+            text_upper = text.upper()
         
-        for field_name, pattern in self.FIELD_PATTERNS.items():
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
+        for field_name, (pattern, literals) in self.FIELD_PATTERNS.items():
+            match = None
+            # Cheap substring prefilter before running the full regex
+            if any(literal in text_upper for literal in literals):
+                match = pattern.search(text)
             if match:
                 value = match.group(1).strip()
                 extracted[field_name] = value
@@ -64,18 +163,19 @@ class FieldExtractor:
         
         # Fallback: If incident_location not found, try to extract from description
         if not extracted.get("incident_location") and extracted.get("accident_description"):
-            desc = extracted["accident_description"].lower()
-            # Look for common location keywords
-            if "driveway" in desc:
+            desc = extracted["accident_description"]
+            # Look for common location keywords in one pass, then apply them by priority
+            keywords = {keyword.lower() for keyword in self.LOCATION_KEYWORD_PATTERN.findall(desc)}
+            if "driveway" in keywords:
                 extracted["incident_location"] = "Driveway"
-            elif "street" in desc:
-                match = re.search(r"(\w+\s+street)", desc, re.IGNORECASE)
+            elif "street" in keywords:
+                match = self.STREET_PATTERN.search(desc)
                 if match:
                     extracted["incident_location"] = match.group(1).title()
-            elif "parking" in desc:
+            elif "parking" in keywords:
                 extracted["incident_location"] = "Parking lot/garage"
-            elif "intersection" in desc:
-                match = re.search(r"intersection\s+of\s+([^.]+)", desc, re.IGNORECASE)
+            elif "intersection" in keywords:
+                match = self.INTERSECTION_PATTERN.search(desc)
                 if match:
                     extracted["incident_location"] = match.group(1).title()
         
@@ -104,36 +204,29 @@ class FieldExtractor:
         """
         missing = []
         
-        # Placeholder values that indicate missing/invalid fields
-        placeholder_values = ["not", "not provided", "n/a", "na", "unknown", "incomplete", "insufficient", "missing"]
-        
         for field in self.MANDATORY_FIELDS:
             value = extracted_fields.get(field)
             
             # Check if field is missing or contains placeholder text
             if not value:
                 missing.append(field)
-            elif isinstance(value, str) and value.lower().strip() in placeholder_values:
+            elif isinstance(value, str) and value.strip().casefold() in self.PLACEHOLDER_VALUES:
                 missing.append(field)
         
         return missing
     
-    def check_for_fraud_indicators(self, text: str) -> List[str]:
+    def check_for_fraud_indicators(self, text: str, text_upper: Optional[str] = None) -> List[str]:
         """
         Check for fraud-related keywords in document
         
         Args:
             text: Document text to analyze
+            text_upper: text.upper(), if the caller already computed it
             
         Returns:
             List of fraud indicators found
         """
-        fraud_keywords = ["fraud", "inconsistent", "staged", "suspicious", "falsified"]
-        indicators = []
-        
-        text_lower = text.lower()
-        for keyword in fraud_keywords:
-            if keyword in text_lower:
-                indicators.append(keyword)
+        if text_upper is None:
+            text_upper = text.upper()
         
-        return indicators
+        return [keyword for keyword in self.FRAUD_KEYWORDS if keyword.upper() in text_upper]
@@ -3,8 +3,16 @@ PDF Parser Module
 Handles extraction of text from PDF and TXT documents
 """
 import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+try:
+    import pypdfium2 as pdfium
+    import pypdfium2.raw as pdfium_c
+    HAS_PDFIUM = True
+except ImportError:
+    HAS_PDFIUM = False
 
 try:
     import pdfplumber
@@ -18,6 +26,14 @@ class DocumentParser:
     
     SUPPORTED_FORMATS = [".pdf", ".txt"]
     
+    # PDFium breaks a letter-spaced line after every overlapping glyph,
+    # which shows up as a run of single-glyph lines
+    LETTER_SPACED_RUN = re.compile(r"(?:^\S\n){3}", re.MULTILINE)
+    
+    # Horizontal gap (in points) between glyphs on a line above which a
+    # space is inserted; pdfplumber's default x_tolerance
+    WORD_GAP = 3
+    
     def __init__(self):
         self.supported_formats = self.SUPPORTED_FORMATS
     
@@ -46,26 +62,86 @@ class DocumentParser:
     def _parse_txt(self, file_path: str) -> str:
         """Parse text file"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            # One bulk read and decode instead of text-mode buffering
+            text = Path(file_path).read_bytes().decode("utf-8", errors="replace")
+            # Text mode translated line endings; keep that for the line-based patterns
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            return text
         except Exception as e:
             raise Exception(f"Error reading TXT file: {str(e)}")
     
     def _parse_pdf(self, file_path: str) -> str:
-        """Parse PDF file"""
+        """Parse PDF file (PDFium when available, pdfplumber as fallback)"""
+        if HAS_PDFIUM:
+            return self._parse_pdf_pdfium(file_path)
+        
         if not HAS_PDFPLUMBER:
-            raise ImportError("pdfplumber is required for PDF parsing. Install with: pip install pdfplumber")
+            raise ImportError("pypdfium2 or pdfplumber is required for PDF parsing. Install with: pip install pypdfium2")
         
         try:
-            text = ""
+            pages = []
             with pdfplumber.open(file_path) as pdf:
                 for page in pdf.pages:
-                    text += page.extract_text() or ""
-                    text += "\n"
-            return text
+                    pages.append(page.extract_text() or "")
+            return self._join_pages(pages)
         except Exception as e:
             raise Exception(f"Error reading PDF file: {str(e)}")
     
+    def _parse_pdf_pdfium(self, file_path: str) -> str:
+        """Parse PDF file with PDFium, which skips pdfplumber's per-character layout objects"""
+        try:
+            pages = []
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                for page in pdf:
+                    textpage = page.get_textpage()
+                    # Explicit bounds: pypdfium2 4.x redirects a no-argument call to
+                    # get_text_bounded(), which drops the breaks checked below.
+                    # PDFium ends lines with CRLF; match pdfplumber's LF output
+                    page_text = textpage.get_text_range(0, textpage.count_chars())
+                    page_text = page_text.replace("\r\n", "\n")
+                    if self.LETTER_SPACED_RUN.search(page_text):
+                        page_text = self._rejoin_letter_spaced(textpage)
+                    pages.append(page_text)
+            finally:
+                pdf.close()
+            return self._join_pages(pages)
+        except Exception as e:
+            raise Exception(f"Error reading PDF file: {str(e)}")
+    
+    def _rejoin_letter_spaced(self, textpage: "pdfium.PdfTextPage") -> str:
+        """Rebuild page text from glyph boxes, dropping PDFium's breaks within a line"""
+        parts = []
+        previous_box = None
+        pending_break = False
+        for index in range(textpage.count_chars()):
+            char = textpage.get_text_range(index, 1)
+            if char in "\r\n" and pdfium_c.FPDFText_IsGenerated(textpage.raw, index) == 1:
+                pending_break = True
+                continue
+            
+            left, bottom, right, top = box = textpage.get_charbox(index)
+            if pending_break:
+                pending_break = False
+                # Keep the break unless the glyph continues rightwards on the same line
+                if (previous_box is not None and left > previous_box[0]
+                        and bottom < previous_box[3] and top > previous_box[1]):
+                    if left - previous_box[2] > self.WORD_GAP:
+                        parts.append(" ")
+                else:
+                    parts.append("\n")
+            
+            parts.append(char)
+            if not char.isspace():
+                previous_box = box
+        return "".join(parts)
+    
+    @staticmethod
+    def _join_pages(pages: List[str]) -> str:
+        """Join page texts in one pass, each followed by a newline"""
+        return "".join(f"{page_text}\n" for page_text in pages)
+    
     def is_supported_format(self, file_path: str) -> bool:
         """Check if file format is supported"""
         file_ext = Path(file_path).suffix.lower()
@@ -10,8 +10,12 @@ class RoutingEngine:
     # Damage threshold in dollars
     FAST_TRACK_THRESHOLD = 25000
     
+    # Claim type keywords that send a claim to the specialist queue
+    SPECIALIST_KEYWORDS = ("injury", "bodily", "personal")
+    
     def __init__(self):
         self.route_history = []
+        self.threshold_display = f"${self.FAST_TRACK_THRESHOLD:,}"
     
     def determine_route(self, extracted_fields: Dict[str, Any], 
                        missing_fields: List[str], 
@@ -45,7 +49,7 @@ class RoutingEngine:
         
         # Rule 3: Check for injury claims (specialist queue)
         claim_type = extracted_fields.get("claim_type", "").lower()
-        if "injury" in claim_type or "bodily" in claim_type or "personal" in claim_type:
+        if any(keyword in claim_type for keyword in self.SPECIALIST_KEYWORDS):
             route = "SPECIALIST_QUEUE"
             reasoning = "Claim type requires specialist handling (injury/bodily harm involved)"
             return {"recommendedRoute": route, "reasoning": reasoning}
@@ -54,10 +58,10 @@ class RoutingEngine:
         damage_value = extracted_fields.get("estimated_damage_value", 0)
         if damage_value < self.FAST_TRACK_THRESHOLD:
             route = "FAST_TRACK"
-            reasoning = f"Low damage amount (${damage_value:,.2f} < ${self.FAST_TRACK_THRESHOLD:,}). Eligible for expedited processing."
+            reasoning = f"Low damage amount (${damage_value:,.2f} < {self.threshold_display}). Eligible for expedited processing."
         else:
             route = "STANDARD_REVIEW"
-            reasoning = f"High damage amount (${damage_value:,.2f} >= ${self.FAST_TRACK_THRESHOLD:,}). Requires standard review."
+            reasoning = f"High damage amount (${damage_value:,.2f} >= {self.threshold_display}). Requires standard review."
         
         return {"recommendedRoute": route, "reasoning": reasoning}
     